@@ -10,133 +10,83 @@ If a better way to resolve conflicts is found, please update the code accordingl
 This works for me so I will keep it this way but updates are welcome :)
 """
 
-from typing import Optional, Tuple
+import functools
+import itertools
+import struct
+import sys
+from typing import Iterable, List, Optional, TextIO, Tuple
 
 
-def extract_fields(instruction: int) -> Tuple[int, int, int, int, int, int, int, int]:
+# Major opcodes used by vector instructions, page 21 of RISC-V V spec 1.0
+_LOAD_FP = 0x07   # Vector loads
+_STORE_FP = 0x27  # Vector stores
+_OP_V = 0x57      # Vector arithmetic and configuration
 
-    # page 21 of RISC-V V spec 1.0
-    opcode = instruction & 0x7F          # bits [6:0]
-    vd_rd = (instruction >> 7) & 0x1F    # bits [11:7]
-    funct3 = (instruction >> 12) & 0x7   # bits [14:12]
-    vs1_rs1 = (instruction >> 15) & 0x1F # bits [19:15]
-    vs2 = (instruction >> 20) & 0x1F     # bits [24:20]
-    vm = (instruction >> 25) & 0x1       # bit [25]
-    funct6 = (instruction >> 26) & 0x3F  # bits [31:26]
-    imm5 = vs1_rs1                       # bits [19:15]
-    
-    return opcode, funct6, vm, vs2, vs1_rs1, funct3, vd_rd, imm5
+
+# Operand categories encoded in funct3, page 42 of RISC-V V spec 1.0
+_OPIVV = 0b000
+_OPFVV = 0b001
+_OPMVV = 0b010
+_OPIVI = 0b011
+_OPIVX = 0b100
+_OPFVF = 0b101
+_OPMVX = 0b110
+_OPCFG = 0b111  # Configuration
+
+
+_CATEGORY_MAP = {
+    _OPIVV: 'OPIVV',
+    _OPFVV: 'OPFVV',
+    _OPMVV: 'OPMVV',
+    _OPIVI: 'OPIVI',
+    _OPIVX: 'OPIVX',
+    _OPFVF: 'OPFVF',
+    _OPMVX: 'OPMVX',
+    _OPCFG: 'OPCFG',
+}
 
 
+# Only used for debugging, the decoder itself works on the raw funct3 value
 def get_operand_category(funct3: int) -> Optional[str]:
     
-    # page 42 of RISC-V V spec 1.0
-    category_map = {
-        0b000: 'OPIVV',
-        0b001: 'OPFVV',
-        0b010: 'OPMVV',
-        0b011: 'OPIVI',
-        0b100: 'OPIVX',
-        0b101: 'OPFVF',
-        0b110: 'OPMVX',
-        0b111: 'OPCFG',  # Configuration
-    }
-    return category_map.get(funct3)
+    return _CATEGORY_MAP.get(funct3)
 
-# Instruction mnemoics from pages 95-98 of RISC-V V spec 1.0
 
-def get_OPIVV_mnemonic(funct6: int, vs2: int, vm: int) -> Tuple[Optional[str], bool]:
+# vmerge and vmv.v.* share funct6 0b010111 in the OPIV* categories, the
+# unmasked form with vs2 == 0 being the move. The move of each category is
+# resolved here once, indexed by funct3
+_MERGE_FUNCT6 = 0b010111
+_MOVE_MNEMONICS = ('vmv.v.v', None, None, 'vmv.v.i', 'vmv.v.x', None, None, None)
 
-    opcode_map = {
-        0b000000: 'vadd',
-        0b000010: 'vsub',
-        0b000100: 'vminu',
-        0b000101: 'vmin',
-        0b000110: 'vmaxu',
-        0b000111: 'vmax',
-        0b001001: 'vand',
-        0b001010: 'vor',
-        0b001011: 'vxor',
-        0b001100: 'vrgather',
-        0b001110: 'vrgatherei16',
-        
-        0b010000: 'vadc',
-        0b010001: 'vmadc',
-        0b010010: 'vsbc',
-        0b010011: 'vmsbc',
-        0b010111: 'vmerge/vmv',
-        0b011000: 'vmseq',
-        0b011001: 'vmsne',
-        0b011010: 'vmsltu',
-        0b011011: 'vmslt',
-        0b011100: 'vmsleu',
-        0b011101: 'vmsle',
-        
-        0b100000: 'vsaddu',
-        0b100001: 'vsadd',
-        0b100010: 'vssubu',
-        0b100011: 'vssub',
-        0b100101: 'vsll',
-        0b101100: 'vsmul',
-        0b101000: 'vsrl',
-        0b101001: 'vsra',
-        0b101010: 'vssrl',
-        0b101011: 'vssra',
-        0b101100: 'vnsrl',
-        0b101101: 'vnsra',
-        0b101110: 'vnclipu',
-        0b101111: 'vnclip',
-        
-        0b110000: 'vwredsumu',
-        0b110001: 'vwredsum'
-    }
-    
-    mnemonic = opcode_map.get(funct6)
-    if mnemonic == "vmerge/vmv":
-        if vm == 1 and vs2 == 0b00000:
-            return ('vmv.v.v', True)
-        return ('vmerge', False)
-    
-    return mnemonic, False
 
-        
-def get_OPIVX_mnemonic(funct6: int, vs2: int, vm: int) -> Tuple[Optional[str], bool]:
-        
-    opcode_map = {    
+def _funct6_table(opcode_map: dict) -> Tuple[Optional[str], ...]:
+
+    # funct6 -> mnemonic map as a 64-slot tuple, indexed by funct6
+    return tuple(opcode_map.get(funct6) for funct6 in range(64))
+
+
+# Instruction mnemoics from pages 95-98 of RISC-V V spec 1.0
+
+
+# Shared by OPIVV, OPIVX and OPIVI
+_OPI_COMMON = {
     0b000000: 'vadd',
-    0b000010: 'vsub',
-    0b000011: 'vrsub',
-    0b000100: 'vminu',
-    0b000101: 'vmin',
-    0b000110: 'vmaxu',
-    0b000111: 'vmax',
     0b001001: 'vand',
     0b001010: 'vor',
     0b001011: 'vxor',
     0b001100: 'vrgather',
-    0b001110: 'vslideup',
-    0b001111: 'vslidedown',
-    
+
     0b010000: 'vadc',
     0b010001: 'vmadc',
-    0b010010: 'vsbc',
-    0b010011: 'vmsbc',
-    0b010111: 'vmerge/vmv',
+    0b010111: 'vmerge',
     0b011000: 'vmseq',
     0b011001: 'vmsne',
-    0b011010: 'vmsltu',
-    0b011011: 'vmslt',
     0b011100: 'vmsleu',
     0b011101: 'vmsle',
-    0b011110: 'vmsgtu',
-    0b011111: 'vmsgt',
-    
+
     0b100000: 'vsaddu',
     0b100001: 'vsadd',
-    0b100010: 'vssubu',
-    0b100011: 'vssub',
     0b100101: 'vsll',
-    0b101100: 'vsmul',
     0b101000: 'vsrl',
     0b101001: 'vsra',
     0b101010: 'vssrl',
@@ -144,459 +94,710 @@ def get_OPIVX_mnemonic(funct6: int, vs2: int, vm: int) -> Tuple[Optional[str], b
     0b101100: 'vnsrl',
     0b101101: 'vnsra',
     0b101110: 'vnclipu',
-    0b101111: 'vnclip'
-    }
-    
-    mnemonic = opcode_map.get(funct6)
-    if mnemonic == "vmerge/vmv":
-        if vm == 1 and vs2 == 0b00000:
-            return ('vmv.v.x', True)
-        return ('vmerge', False)
-    
-    return mnemonic, False
-        
-        
+    0b101111: 'vnclip',
+}
+
+
+# OPIVV and OPIVX only, these have no immediate form
+_OPI_VV_VX = {
+    0b000010: 'vsub',
+    0b000100: 'vminu',
+    0b000101: 'vmin',
+    0b000110: 'vmaxu',
+    0b000111: 'vmax',
+
+    0b010010: 'vsbc',
+    0b010011: 'vmsbc',
+    0b011010: 'vmsltu',
+    0b011011: 'vmslt',
+
+    0b100010: 'vssubu',
+    0b100011: 'vssub',
+    0b100111: 'vsmul',
+}
+
+
+# OPIVX and OPIVI only, these have no vector-vector form
+_OPI_VX_VI = {
+    0b000011: 'vrsub',
+    0b001110: 'vslideup',
+    0b001111: 'vslidedown',
+    0b011110: 'vmsgtu',
+    0b011111: 'vmsgt',
+}
+
+
+_OPIVV_MAP = {
+    **_OPI_COMMON,
+    **_OPI_VV_VX,
+    0b001110: 'vrgatherei16',
+    0b110000: 'vwredsumu',
+    0b110001: 'vwredsum',
+}
+
+
+_OPIVV_TABLE = _funct6_table(_OPIVV_MAP)
+
+
+def get_OPIVV_mnemonic(funct6: int, vs2: int, vm: int) -> Tuple[Optional[str], bool]:
+
+    if funct6 == _MERGE_FUNCT6 and vm == 1 and vs2 == 0b00000:
+        return (_MOVE_MNEMONICS[_OPIVV], True)
+
+    return (_OPIVV_TABLE[funct6], False)
+
+
+_OPIVX_MAP = {
+    **_OPI_COMMON,
+    **_OPI_VV_VX,
+    **_OPI_VX_VI,
+}
+
+
+_OPIVX_TABLE = _funct6_table(_OPIVX_MAP)
+
+
+def get_OPIVX_mnemonic(funct6: int, vs2: int, vm: int) -> Tuple[Optional[str], bool]:
+
+    if funct6 == _MERGE_FUNCT6 and vm == 1 and vs2 == 0b00000:
+        return (_MOVE_MNEMONICS[_OPIVX], True)
+
+    return (_OPIVX_TABLE[funct6], False)
+
+
+_OPIVI_MAP = {
+    **_OPI_COMMON,
+    **_OPI_VX_VI,
+    0b100111: 'vmv',
+}
+
+
+_OPIVI_TABLE = _funct6_table(_OPIVI_MAP)
+
+
 def get_OPIVI_mnemonic(funct6: int, vs2: int, vm: int) -> Tuple[Optional[str], bool]:    
-     
-    opcode_map = {
-        0b000000: 'vadd',
-        0b000011: 'vrsub',
-        0b001001: 'vand',
-        0b001010: 'vor',
-        0b001011: 'vxor',
-        0b001100: 'vrgather',
-        0b001110: 'vslideup',
-        0b001111: 'vslidedown',
-        
-        0b010000: 'vadc',
-        0b010001: 'vmadc',
-        0b010111: 'vmerge/vmv',
-        0b011000: 'vmseq',
-        0b011001: 'vmsne',
-        0b011100: 'vmsleu',
-        0b011101: 'vmsle',
-        0b011110: 'vmsgtu',
-        0b011111: 'vmsgt',
-        
-        0b100000: 'vsaddu',
-        0b100001: 'vsadd',
-        0b100101: 'vsll',
-        
-        0b100111: 'vmv',
-        
-        0b101000: 'vsrl',
-        0b101001: 'vsra',
-        0b101010: 'vssrl',
-        0b101011: 'vssra',
-        0b101100: 'vnsrl',
-        0b101101: 'vnsra',
-        0b101110: 'vnclipu',
-        0b101111: 'vnclip'
-    }
-    
-    mnemonic = opcode_map.get(funct6)
-    if mnemonic == "vmerge/vmv":
-        if vm == 1 and vs2 == 0b00000:
-            return ('vmv.v.i', True)
-        return ('vmerge', False)
-    
+
+    if funct6 == _MERGE_FUNCT6 and vm == 1 and vs2 == 0b00000:
+        return (_MOVE_MNEMONICS[_OPIVI], True)
+
+    mnemonic = _OPIVI_TABLE[funct6]
     if mnemonic == 'vmv':
         return (mnemonic, True)
     
     return (mnemonic, False)
 
 
+_OPMVV_MAP = {
+    0b000000: 'vredsum',
+    0b000001: 'vredand',
+    0b000010: 'vredor',
+    0b000011: 'vredxor',
+    0b000100: 'vredminu',
+    0b000101: 'vredmin',
+    0b000110: 'vredmaxu',
+    0b000111: 'vredmax',
+    0b001000: 'vaaddu',
+    0b001001: 'vaadd',
+    0b001010: 'vasubu',
+    0b001011: 'vasub',
+
+    # These should've been handeled earlier
+    0b010000: 'VWXUNARY0',
+    0b010010: 'VXUNARY0',
+    0b010100: 'VMUNARY0',
+
+    0b010111: 'vcompress',
+    0b011000: 'vmandnot',
+    0b011001: 'vmand',
+    0b011010: 'vmor',
+    0b011011: 'vmxor',
+    0b011100: 'vmornot',
+    0b011101: 'vmnand',
+    0b011110: 'vmnor',
+    0b011111: 'vmxnor',
+
+    0b100000: 'vdivu',
+    0b100001: 'vdiv',
+    0b100010: 'vremu',
+    0b100011: 'vrem',
+    0b100100: 'vmulhu',
+    0b100101: 'vmul',
+    0b100110: 'vmulhsu',
+    0b100111: 'vmulh',
+    0b101001: 'vmadd',
+    0b101011: 'vnmsub',
+    0b101101: 'vmacc',
+    0b101111: 'vnmsac',
+
+    0b110000: 'vwaddu',
+    0b110001: 'vwadd',
+    0b110010: 'vwsubu',
+    0b110011: 'vwsub',
+    0b110100: 'vwaddu.w',
+    0b110101: 'vwadd.w',
+    0b110110: 'vwsubu.w',
+    0b110111: 'vwsub.w',
+    0b111000: 'vwmulu',
+    0b111010: 'vwmulsu',
+    0b111011: 'vwmul',
+    0b111100: 'vwmaccu',
+    0b111101: 'vwmacc',
+    0b111111: 'vwmaccsu'
+}
+
+
+_OPMVV_UNARY_MAP = {
+    # VWXUNARY0
+    (0b010000, 0b00000): 'vmv.x.s',
+    (0b010000, 0b10000): 'vcpop.m',
+    (0b010000, 0b10001): 'vfirst.m',
+    #VXUNARY0
+    (0b010010, 0b00010): 'vzext.vf8',
+    (0b010010, 0b00011): 'vsext.vf8',
+    (0b010010, 0b00100): 'vzext.vf4',
+    (0b010010, 0b00101): 'vsext.vf4',
+    (0b010010, 0b00110): 'vzext.vf2',
+    (0b010010, 0b00111): 'vsext.vf2',
+    #VMUNARY0
+    (0b010100, 0b00001): 'vmsbf.m',
+    (0b010100, 0b00010): 'vmsof.m',
+    (0b010100, 0b00011): 'vmsif.m',
+    (0b010100, 0b10000): 'viota.m',
+    (0b010100, 0b10001): 'vid.v', # Not sure about this one
+}
+
+
+_OPMVV_TABLE = _funct6_table(_OPMVV_MAP)
+
+
 def get_OPMVV_mnemonic(funct6: int, vs1: int) -> Tuple[Optional[str], bool]:
  
-    if funct6 == 0b010000 or funct6 == 0b010010 or funct6 == 0b010100:
-        opcode_map = {
-            # VWXUNARY0
-            (0b010000, 0b00000): 'vmv.x.s',
-            (0b010000, 0b10000): 'vcpop.m',
-            (0b010000, 0b10001): 'vfirst.m',
-            #VXUNARY0
-            (0b010010, 0b00010): 'vzext.vf8',
-            (0b010010, 0b00011): 'vsext.vf8',
-            (0b010010, 0b00100): 'vzext.vf4',
-            (0b010010, 0b00101): 'vsext.vf4',
-            (0b010010, 0b00110): 'vzext.vf2',
-            (0b010010, 0b00111): 'vsext.vf2',
-            #VMUNARY0
-            (0b010100, 0b00001): 'vmsbf.m',
-            (0b010100, 0b00010): 'vmsof.m',
-            (0b010100, 0b00011): 'vmsif.m',
-            (0b010100, 0b10000): 'viota.m',
-            (0b010100, 0b10001): 'vid.v', # Not sure about this one
-        }
-        return opcode_map.get((funct6, vs1)), True
+    slot = (_OPMVV << 6) | funct6
+    if _UNARY_SLOT_FLAGS[slot]:
+        return (_UNARY_TABLE.get((slot << 5) | vs1), True)
     
-    opcode_map = {
-        0b000000: 'vredsum',
-        0b000001: 'vredand',
-        0b000010: 'vredor',
-        0b000011: 'vredxor',
-        0b000100: 'vredminu',
-        0b000101: 'vredmin',
-        0b000110: 'vredmaxu',
-        0b000111: 'vredmax',
-        0b001000: 'vaaddu',
-        0b001001: 'vaadd',
-        0b001010: 'vasubu',
-        0b001011: 'vasub',
-        
-        # These should've been handeled earlier
-        0b010000: 'VWXUNARY0',
-        0b010010: 'VXUNARY0',
-        0b010100: 'VMUNARY0',
-        
-        0b010111: 'vcompress',
-        0b011000: 'vmandnot',
-        0b011001: 'vmand',
-        0b011010: 'vmor',
-        0b011011: 'vmxor',
-        0b011100: 'vmornot',
-        0b011101: 'vmnand',
-        0b011110: 'vmnor',
-        0b011111: 'vmxnor',
-        
-        0b100000: 'vdivu',
-        0b100001: 'vdiv',
-        0b100010: 'vremu',
-        0b100011: 'vrem',
-        0b100100: 'vmulhu',
-        0b100101: 'vmul',
-        0b100110: 'vmulhsu',
-        0b100111: 'vmulh',
-        0b101001: 'vmadd',
-        0b101011: 'vnmsub',
-        0b101101: 'vmacc',
-        0b101111: 'vnmsac',
-        
-        0b110000: 'vwaddu',
-        0b110001: 'vwadd',
-        0b110010: 'vwsubu',
-        0b110011: 'vwsub',
-        0b110100: 'vwaddu.w',
-        0b110101: 'vwadd.w',
-        0b110110: 'vwsubu.w',
-        0b110111: 'vwsub.w',
-        0b111000: 'vwmulu',
-        0b111010: 'vwmulsu',
-        0b111011: 'vwmul',
-        0b111100: 'vwmaccu',
-        0b111101: 'vwmacc',
-        0b111111: 'vwmaccsu'
-    }
-    return (opcode_map.get(funct6), False)
+    return (_OPMVV_TABLE[funct6], False)
+
+
+_OPMVX_MAP = {
+    0b001000: 'vaaddu',
+    0b001001: 'vaadd',
+    0b001010: 'vasubu',
+    0b001011: 'vasub',
+    0b001110: 'vslide1up',
+    0b001111: 'vslide1down',
+
+    0b100000: 'vdivu',
+    0b100001: 'vdiv',
+    0b100010: 'vremu',
+    0b100011: 'vrem',
+    0b100100: 'vmulhu',
+    0b100101: 'vmul',
+    0b100110: 'vmulhsu',
+    0b100111: 'vmulh',
+    0b101001: 'vmadd',
+    0b101011: 'vnmsub',
+    0b101101: 'vmacc',
+    0b101111: 'vnmsac',
+
+    0b110000: 'vwaddu',
+    0b110001: 'vwadd',
+    0b110010: 'vwsubu',
+    0b110011: 'vwsub',
+    0b110100: 'vwaddu.w',
+    0b110101: 'vwadd.w',
+    0b110110: 'vwsubu.w',
+    0b110111: 'vwsub.w',
+    0b111000: 'vwmulu',
+    0b111010: 'vwmulsu',
+    0b111011: 'vwmul',
+    0b111100: 'vwmaccu',
+    0b111101: 'vwmacc',
+    0b111110: 'vwmaccus',
+    0b111111: 'vwmaccsu'
+}
+
+
+_OPMVX_UNARY_MAP = {
+    # VRXUNARY0
+    (0b010000, 0b00000): 'vmv.s.x',
+}
+
+
+_OPMVX_TABLE = _funct6_table(_OPMVX_MAP)
+
 
 def get_OPMVX_mnemonic(funct6: int, vs2: int) -> Tuple[Optional[str], bool]:
  
-    if funct6 == 0b010000:
-        opcode_map = {
-            # VRXUNARY0
-            (0b010000, 0b00000): 'vmv.s.x',
-        }
-        return (opcode_map.get((funct6, vs2)), True)
- 
-    opcode_map = {
-        0b001000: 'vaaddu',
-        0b001001: 'vaadd',
-        0b001010: 'vasubu',
-        0b001011: 'vasub',
-        0b001110: 'vslide1up',
-        0b001111: 'vslide1down',
-        
-        0b100000: 'vdivu',
-        0b100001: 'vdiv',
-        0b100010: 'vremu',
-        0b100011: 'vrem',
-        0b100100: 'vmulhu',
-        0b100101: 'vmul',
-        0b100110: 'vmulhsu',
-        0b100111: 'vmulh',
-        0b101001: 'vmadd',
-        0b101011: 'vnmsub',
-        0b101101: 'vmacc',
-        0b101111: 'vnmsac',
-        
-        0b110000: 'vwaddu',
-        0b110001: 'vwadd',
-        0b110010: 'vwsubu',
-        0b110011: 'vwsub',
-        0b110100: 'vwaddu.w',
-        0b110101: 'vwadd.w',
-        0b110110: 'vwsubu.w',
-        0b110111: 'vwsub.w',
-        0b111000: 'vwmulu',
-        0b111010: 'vwmulsu',
-        0b111011: 'vwmul',
-        0b111100: 'vwmaccu',
-        0b111101: 'vwmacc',
-        0b111110: 'vwmaccus',
-        0b111111: 'vwmaccsu'
-    }
-    
-    return (opcode_map.get(funct6), False)
+    slot = (_OPMVX << 6) | funct6
+    if _UNARY_SLOT_FLAGS[slot]:
+        return (_UNARY_TABLE.get((slot << 5) | vs2), True)
 
+    return (_OPMVX_TABLE[funct6], False)
+
+
+_OPFVV_MAP = {
+    0b000000: 'vfadd',
+    0b000001: 'vfredusum',
+    0b000010: 'vfsub',
+    0b000011: 'vfredosum',
+    0b000100: 'vfmin',
+    0b000101: 'vfredmin',
+    0b000110: 'vfmax',
+    0b000111: 'vfredmax',
+    0b001000: 'vfsgnj',
+    0b001001: 'vfsgnjn',
+    0b001010: 'vfsgnjx',
+    0b001110: 'vfslide1up',
+    0b001111: 'vfslide1down',
+
+    # Should've been handeled earlier
+    0b010000: 'VWFUNARY0',
+    0b010010: 'VFUNARY0',
+    0b010011: 'VFUNARY1',
+
+    0b011000: 'vmfeq',
+    0b011001: 'vmfle',
+    0b011011: 'vmflt',
+    0b011100: 'vmfne',
+
+    0b100000: 'vfdiv',
+    0b100100: 'vfmul',
+    0b101000: 'vfmadd',
+    0b101001: 'vfnmadd',
+    0b101010: 'vfmsub',
+    0b101011: 'vfnmsub',
+    0b101100: 'vfmacc',
+    0b101101: 'vfnmacc',
+    0b101110: 'vfmsac',
+    0b101111: 'vfnmsac',
+
+    0b110000: 'vfwadd',
+    0b110001: 'vfwredusum',
+    0b110010: 'vfwsub',
+    0b110011: 'vfwredosum',
+    0b110100: 'vfwadd.w',
+    0b110110: 'vfwsub.w',
+    0b111000: 'vfwmul',
+    0b111100: 'vfwmacc',
+    0b111101: 'vfwnmacc',
+    0b111110: 'vfwmsac',
+    0b111111: 'vfwnmsac',
+}
+
+
+_OPFVV_UNARY_MAP = {
+    # VWFUNARY0
+    (0b010000, 0b00000): 'vfmv.f.s',
+
+    #VFUNARY0
+    (0b010010, 0b00000): 'vfcvt.xu.f.v',
+    (0b010010, 0b00001): 'vfcvt.x.f.v',
+    (0b010010, 0b00010): 'vfcvt.f.xu.v',
+    (0b010010, 0b00011): 'vfcvt.f.x.v',
+    (0b010010, 0b00110): 'vfcvt.rtz.xu.f.v',
+    (0b010010, 0b00111): 'vfcvt.rtz.x.f.v',
+
+    (0b010010, 0b01000): 'vfwcvt.xu.f.v',
+    (0b010010, 0b01001): 'vfwcvt.x.f.v',
+    (0b010010, 0b01010): 'vfwcvt.f.xu.v',
+    (0b010010, 0b01011): 'vfwcvt.f.x.v',
+    (0b010010, 0b01100): 'vfwcvt.f.f.v',
+    (0b010010, 0b01110): 'vfwcvt.rtz.xu.f.v',
+    (0b010010, 0b01111): 'vfwcvt.rtz.x.f.v',
+
+    (0b010010, 0b10000): 'vfncvt.xu.f.w',
+    (0b010010, 0b10001): 'vfncvt.x.f.w',
+    (0b010010, 0b10010): 'vfncvt.f.xu.w',
+    (0b010010, 0b10011): 'vfncvt.f.x.w',
+    (0b010010, 0b10100): 'vfncvt.f.f.w',
+    (0b010010, 0b10101): 'vfncvt.rod.f.f.w',
+    (0b010010, 0b10110): 'vfncvt.rtz.xu.f.w',
+    (0b010010, 0b10111): 'vfncvt.rtz.x.f.w',
+
+    #VFUNARY1
+    (0b010011, 0b00000): 'vfsqrt.v',
+    (0b010011, 0b00100): 'vfrsqrt7.v',
+    (0b010011, 0b00101): 'vfrec7.v',
+    (0b010011, 0b10000): 'vfclass.v',
+}
+
+
+_OPFVV_TABLE = _funct6_table(_OPFVV_MAP)
 
 
 def get_OPFVV_mnemonic(funct6: int, vs1: int) -> Tuple[Optional[str], bool]:
     
-    if funct6 == 0b010000 or funct6 == 0b010010 or funct6 == 0b010011:
-        opcode_map = {
-            # VWFUNARY0
-            (0b010000, 0b00000): 'vfmv.f.s',
-            
-            #VFUNARY0
-            (0b010010, 0b00000): 'vfcvt.xu.f.v',
-            (0b010010, 0b00001): 'vfcvt.x.f.v',
-            (0b010010, 0b00010): 'vfcvt.f.xu.v',
-            (0b010010, 0b00011): 'vfcvt.f.x.v',
-            (0b010010, 0b00110): 'vfcvt.rtz.xu.f.v',
-            (0b010010, 0b00111): 'vfcvt.rtz.x.f.v',
-            
-            (0b010010, 0b01000): 'vfwcvt.xu.f.v',
-            (0b010010, 0b01001): 'vfwcvt.x.f.v',
-            (0b010010, 0b01010): 'vfwcvt.f.xu.v',
-            (0b010010, 0b01011): 'vfwcvt.f.x.v',
-            (0b010010, 0b01100): 'vfwcvt.f.f.v',
-            (0b010010, 0b01110): 'vfwcvt.rtz.xu.f.v',
-            (0b010010, 0b01111): 'vfwcvt.rtz.x.f.v',
-            
-            (0b010010, 0b10000): 'vfncvt.xu.f.w',
-            (0b010010, 0b10001): 'vfncvt.x.f.w',
-            (0b010010, 0b10010): 'vfncvt.f.xu.w',
-            (0b010010, 0b10011): 'vfncvt.f.x.w',
-            (0b010010, 0b10100): 'vfncvt.f.f.w',
-            (0b010010, 0b10101): 'vfncvt.rod.f.f.w',
-            (0b010010, 0b10110): 'vfncvt.rtz.xu.f.w',
-            (0b010010, 0b10111): 'vfncvt.rtz.x.f.w',
-                      
-            #VFUNARY1
-            (0b010011, 0b00000): 'vfsqrt.v',
-            (0b010011, 0b00100): 'vfrsqrt7.v',
-            (0b010011, 0b00101): 'vfrec7.v',
-            (0b010011, 0b10000): 'vfclass.v',
-        }
-        return (opcode_map.get((funct6, vs1)), True)
+    slot = (_OPFVV << 6) | funct6
+    if _UNARY_SLOT_FLAGS[slot]:
+        return (_UNARY_TABLE.get((slot << 5) | vs1), True)
     
-    opcode_map = {
-        0b000000: 'vfadd',
-        0b000001: 'vfredusum',
-        0b000010: 'vfsub',
-        0b000011: 'vfredosum',
-        0b000100: 'vfmin',
-        0b000101: 'vfredmin',
-        0b000110: 'vfmax',
-        0b000111: 'vfredmax',
-        0b001000: 'vfsgnj',
-        0b001001: 'vfsgnjn',
-        0b001010: 'vfsgnjx',
-        0b001110: 'vfslide1up',
-        0b001111: 'vfslide1down',
-        
-        # Should've been handeled earlier
-        0b010000: 'VWFUNARY0',
-        0b010010: 'VFUNARY0',
-        0b010011: 'VFUNARY1',
-        
-        0b011000: 'vmfeq', 
-        0b011001: 'vmfle',
-        0b011011: 'vmflt',
-        0b011100: 'vmfne',
-        
-        0b100000: 'vfdiv',
-        0b100100: 'vfmul',
-        0b101000: 'vfmadd',
-        0b101001: 'vfnmadd',
-        0b101010: 'vfmsub',
-        0b101011: 'vfnmsub',
-        0b101100: 'vfmacc',
-        0b101101: 'vfnmacc',
-        0b101110: 'vfmsac',
-        0b101111: 'vfnmsac',
-        
-        0b110000: 'vfwadd',
-        0b110001: 'vfwredusum',
-        0b110010: 'vfwsub',
-        0b110011: 'vfwredosum',
-        0b110100: 'vfwadd.w',
-        0b110110: 'vfwsub.w',
-        0b111000: 'vfwmul',
-        0b111100: 'vfwmacc',
-        0b111101: 'vfwnmacc',   
-        0b111110: 'vfwmsac',
-        0b111111: 'vfwnmsac',
-    }
-    return (opcode_map.get(funct6), False)
-
-       
+    return (_OPFVV_TABLE[funct6], False)
+
+
+_OPFVF_MAP = {
+    0b000000: 'vfadd',
+    0b000010: 'vfsub',
+    0b000100: 'vfmin',
+    0b000110: 'vfmax',
+    0b001000: 'vfsgnj',
+    0b001001: 'vfsgnjn',
+    0b001010: 'vfsgnjx',
+    0b001110: 'vfslide1up',
+    0b001111: 'vfslide1down',
+
+    0b010111: 'vfmerge',
+    0b011000: 'vmfeq',
+    0b011001: 'vmfle',
+    0b011011: 'vmflt',
+    0b011100: 'vmfne',
+    0b011101: 'vmfgt',
+    0b011111: 'vmfge',
+
+    0b100000: 'vfdiv',
+    0b100001: 'vfrdiv',
+    0b100100: 'vfmul',
+    0b100111: 'vfrsub',
+    0b101000: 'vfmadd',
+    0b101001: 'vfnmadd',
+    0b101010: 'vfmsub',
+    0b101011: 'vfnmsub',
+    0b101100: 'vfmacc',
+    0b101101: 'vfnmacc',
+    0b101110: 'vfmsac',
+    0b101111: 'vfnmsac',
+
+    0b110000: 'vfwadd',
+    0b110010: 'vfwsub',
+    0b110100: 'vfwadd.w',
+    0b110110: 'vfwsub.w',
+    0b111000: 'vfwmul',
+    0b111100: 'vfwmacc',
+    0b111101: 'vfwnmacc',
+    0b111110: 'vfwmsac',
+    0b111111: 'vfwnmsac',
+}
+
+
+_OPFVF_UNARY_MAP = {
+    # VRFUNARY0
+    (0b010000, 0b00000): 'vfmv.s.f'
+}
+
+
+_OPFVF_TABLE = _funct6_table(_OPFVF_MAP)
+
+
 def get_OPFVF_mnemonic(funct6: int, vs2: int) -> Tuple[Optional[str], bool]:
         
-    if funct6 == 0b010000:
-        opcode_map = {
-            # VRFUNARY0
-            (0b010000, 0b00000): 'vfmv.s.f'
-        }
-        return (opcode_map.get((funct6, vs2)), True)
-        
-    opcode_map = { 
-        0b000000: 'vfadd',
-        0b000010: 'vfsub',
-        0b000100: 'vfmin',
-        0b000110: 'vfmax',
-        0b001000: 'vfsgnj',
-        0b001001: 'vfsgnjn',
-        0b001010: 'vfsgnjx',
-        0b001110: 'vfslide1up',
-        0b001111: 'vfslide1down',
-        
-        0b010111: 'vfmerge',
-        0b011000: 'vmfeq', 
-        0b011001: 'vmfle',
-        0b011011: 'vmflt',
-        0b011100: 'vmfne',
-        0b011101: 'vmfgt',
-        0b011111: 'vmfge',
-        
-        0b100000: 'vfdiv',
-        0b100001: 'vfrdiv',
-        0b100100: 'vfmul',
-        0b100111: 'vfrsub',
-        0b101000: 'vfmadd',
-        0b101001: 'vfnmadd',
-        0b101010: 'vfmsub',
-        0b101011: 'vfnmsub',
-        0b101100: 'vfmacc',
-        0b101101: 'vfnmacc',
-        0b101110: 'vfmsac',
-        0b101111: 'vfnmsac',
-        
-        0b110000: 'vfwadd',
-        0b110010: 'vfwsub',
-        0b110100: 'vfwadd.w',
-        0b110110: 'vfwsub.w',
-        0b111000: 'vfwmul',
-        0b111100: 'vfwmacc',
-        0b111101: 'vfwnmacc',   
-        0b111110: 'vfwmsac',
-        0b111111: 'vfwnmsac',
-
-    }
-    
-    return (opcode_map.get(funct6), False)
+    slot = (_OPFVF << 6) | funct6
+    if _UNARY_SLOT_FLAGS[slot]:
+        return (_UNARY_TABLE.get((slot << 5) | vs2), True)
 
+    return (_OPFVF_TABLE[funct6], False)
 
-def get_config_mnemonic(funct6: int, vs2: int, vs1_rs1: int) -> Tuple[Optional[str], bool]:
 
-    if funct6 == 0b000000:
-        if vs2 == 0b11111:
-            return ('vsetvli', False)
-        else:
-            return ('vsetvl', False)
-    elif funct6 == 0b100000:
+def get_config_mnemonic(funct6: int, vm: int) -> Tuple[Optional[str], bool]:
+
+    # Selected by bits [31:25], i.e. funct6 and vm. Shared by format_OPCFG and
+    # get_mnemonic_id so the text and the id always agree
+    if (funct6 >> 5) == 0b0:
+        return ('vsetvli', False)
+    elif (funct6 >> 4) == 0b11:
         return ('vsetivli', False)
+    elif funct6 == 0b100000 and vm == 0:
+        return ('vsetvl', False)
     
     return (None, False)
 
 
-def get_mnemonic(funct6: int, category: str, vs2: int, vs1_rs1: int, vm: int) -> Tuple[Optional[str], bool]:
+# Placeholder mnemonics whose final form depends on vs2 or vs1 and therefore
+# can't be stored in the flat table below
+_SUBDECODED_MNEMONICS = {
+    'vmv',
+    'VWXUNARY0', 'VXUNARY0', 'VMUNARY0',
+    'VWFUNARY0', 'VFUNARY0', 'VFUNARY1',
+}
 
-    if category == 'OPIVV':
-        return get_OPIVV_mnemonic(funct6, vs2, vm)
-    elif category == 'OPIVX':
-        return get_OPIVX_mnemonic(funct6, vs2, vm)
-    elif category == 'OPIVI':
-        return get_OPIVI_mnemonic(funct6, vs2, vm)
-    elif category == 'OPMVV':
-        return get_OPMVV_mnemonic(funct6, vs1_rs1)
-    elif category == 'OPMVX':
-        return get_OPMVX_mnemonic(funct6, vs2)
-    elif category == 'OPFVV':
-        return get_OPFVV_mnemonic(funct6, vs1_rs1)
-    elif category == 'OPFVF':
-        return get_OPFVF_mnemonic(funct6, vs2)
-    elif category == 'OPCFG':
-        return get_config_mnemonic(funct6, vs2, vs1_rs1)
-    return None, False
 
+# funct6 -> mnemonic map of each category, paired with its funct3
+_OPCODE_MAPS = (
+    (_OPIVV, _OPIVV_MAP), (_OPFVV, _OPFVV_MAP),
+    (_OPMVV, _OPMVV_MAP), (_OPIVI, _OPIVI_MAP),
+    (_OPIVX, _OPIVX_MAP), (_OPFVF, _OPFVF_MAP),
+    (_OPMVX, _OPMVX_MAP),
+)
 
-def decode_vtype(vtype: int, vll: int) -> str:
 
-    if vll == 0b1:
-        return "ILLEGAL"
-    
+def _build_mnemonic_table() -> Tuple[Optional[str], ...]:
+
+    # One slot per (funct3, funct6) pair, indexed by (funct3 << 6) | funct6
+    table = [None] * (8 * 64)
+    for funct3, opcode_map in _OPCODE_MAPS:
+        for funct6, mnemonic in opcode_map.items():
+            if mnemonic in _SUBDECODED_MNEMONICS:
+                continue
+            # Leave vmerge out where it competes with a vmv.v.* move
+            if funct6 == _MERGE_FUNCT6 and _MOVE_MNEMONICS[funct3] is not None:
+                continue
+            table[(funct3 << 6) | funct6] = sys.intern(mnemonic)
+    return tuple(table)
+
+
+_MNEM_TABLE = _build_mnemonic_table()
+
+
+def _build_unary_table() -> Tuple[dict, bytes]:
+
+    # The unary groups flattened into one dict keyed by (slot << 5) | vs, where
+    # slot is the _MNEM_TABLE index and vs is vs1 for OPMVV/OPFVV, vs2 otherwise.
+    # Also returns a flag byte per slot, set where the slot is a unary group
+    table = {}
+    flags = bytearray(8 * 64)
+    for funct3, unary_map in ((_OPMVV, _OPMVV_UNARY_MAP), (_OPMVX, _OPMVX_UNARY_MAP),
+                              (_OPFVV, _OPFVV_UNARY_MAP), (_OPFVF, _OPFVF_UNARY_MAP)):
+        for (funct6, vs), mnemonic in unary_map.items():
+            slot = (funct3 << 6) | funct6
+            table[(slot << 5) | vs] = sys.intern(mnemonic)
+            flags[slot] = 1
+    return table, bytes(flags)
+
+
+_UNARY_TABLE, _UNARY_SLOT_FLAGS = _build_unary_table()
+
+
+# Category helpers indexed by funct3, all taking (funct6, vs2, vs1_rs1, vm)
+_FUNCT3_DISPATCH = (
+    lambda funct6, vs2, vs1_rs1, vm: get_OPIVV_mnemonic(funct6, vs2, vm),
+    lambda funct6, vs2, vs1_rs1, vm: get_OPFVV_mnemonic(funct6, vs1_rs1),
+    lambda funct6, vs2, vs1_rs1, vm: get_OPMVV_mnemonic(funct6, vs1_rs1),
+    lambda funct6, vs2, vs1_rs1, vm: get_OPIVI_mnemonic(funct6, vs2, vm),
+    lambda funct6, vs2, vs1_rs1, vm: get_OPIVX_mnemonic(funct6, vs2, vm),
+    lambda funct6, vs2, vs1_rs1, vm: get_OPFVF_mnemonic(funct6, vs2),
+    lambda funct6, vs2, vs1_rs1, vm: get_OPMVX_mnemonic(funct6, vs2),
+    lambda funct6, vs2, vs1_rs1, vm: get_config_mnemonic(funct6, vm),
+)
+
+
+def get_mnemonic(funct6: int, funct3: int, vs2: int, vs1_rs1: int, vm: int) -> Tuple[Optional[str], bool]:
+
+    index = (funct3 << 6) | funct6
+    mnemonic = _MNEM_TABLE[index]
+    if mnemonic is not None:
+        return mnemonic, False
+
+    if _UNARY_SLOT_FLAGS[index]:
+        vs = vs1_rs1 if funct3 == _OPMVV or funct3 == _OPFVV else vs2
+        return _UNARY_TABLE.get((index << 5) | vs), True
+
+    # Remaining empty slots are unknown or need vm/vs2 to be resolved
+    return _FUNCT3_DISPATCH[funct3](funct6, vs2, vs1_rs1, vm)
+
+
+def _collect_mnemonics() -> Tuple[str, ...]:
+
+    # Every mnemonic get_mnemonic can produce. Empty table slots are swept over
+    # vm and vs2/vs1 together since the sub-decoded groups use one or the other
+    mnemonics = {'vsetvli', 'vsetivli', 'vsetvl'}
+    for index, mnemonic in enumerate(_MNEM_TABLE):
+        if mnemonic is not None:
+            mnemonics.add(mnemonic)
+            continue
+        funct3, funct6 = index >> 6, index & 0x3F
+        if funct3 == _OPCFG:
+            continue
+        for field in range(32):
+            for vm in (0, 1):
+                mnemonic, _ = get_mnemonic(funct6, funct3, field, field, vm)
+                if mnemonic is not None:
+                    mnemonics.add(mnemonic)
+    return tuple(sorted(mnemonics))
+
+
+# Every OP-V mnemonic gets a small integer id, so callers that only filter or
+# count instructions can skip building their text
+MNEMONICS = _collect_mnemonics()
+_MNEMONIC_IDS = {mnemonic: mnemonic_id for mnemonic_id, mnemonic in enumerate(MNEMONICS)}
+
+# Ids of the flat mnemonic table packed one byte per slot, so the whole table
+# is 512 bytes instead of 512 object pointers
+_NO_MNEMONIC_ID = 0xFF
+_MNEM_ID_TABLE = bytes(_NO_MNEMONIC_ID if mnemonic is None else _MNEMONIC_IDS[mnemonic]
+                       for mnemonic in _MNEM_TABLE)
+
+
+def mnemonic_name(mnemonic_id: int) -> str:
+
+    return MNEMONICS[mnemonic_id]
+
+
+def get_mnemonic_id(instruction: int) -> Optional[int]:
+
+    # Loads/stores and other opcodes have no id
+    if (instruction & 0x7F) != _OP_V:
+        return None
+
+    # (funct3 << 6) | funct6 taken straight from the instruction word
+    mnemonic_id = _MNEM_ID_TABLE[((instruction >> 6) & 0x1C0) | ((instruction >> 26) & 0x3F)]
+    if mnemonic_id != _NO_MNEMONIC_ID:
+        return mnemonic_id
+
+    funct3 = (instruction >> 12) & 0x7
+    funct6 = (instruction >> 26) & 0x3F
+    vs2 = (instruction >> 20) & 0x1F
+    vs1_rs1 = (instruction >> 15) & 0x1F
+    vm = (instruction >> 25) & 0x1
+    mnemonic, _ = get_mnemonic(funct6, funct3, vs2, vs1_rs1, vm)
+    if mnemonic is None:
+        return None
+    return _MNEMONIC_IDS[mnemonic]
+
+
+def get_mnemonic_ids(instructions: Iterable[int]) -> bytes:
+
+    # One id byte per instruction word, 0xFF where get_mnemonic_id gives None.
+    # For batch consumers (histograms, filters) that never need the text
+    get_id = get_mnemonic_id
+    ids = [get_id(instruction & 0xFFFFFFFF) for instruction in _as_ints(instructions)]
+    return bytes(_NO_MNEMONIC_ID if mnemonic_id is None else mnemonic_id for mnemonic_id in ids)
+
+
+# e8  SEW=8b 
+# e16 SEW=16b 
+# e32 SEW=32b 
+# e64 SEW=64b 
+# vsew, indexed by bits [5:3]; 4-7 are reserved
+_SEW_MAP = ("e8", "e16", "e32", "e64", None, None, None, None)
+
+# mf8  # LMUL=1/8 
+# mf4  # LMUL=1/4 
+# mf2  # LMUL=1/2 
+# m1   # LMUL=1, assumed if m setting absent 
+# m2   # LMUL=2 
+# m4   # LMUL=4 
+# m8   # LMUL=8
+_LMUL_MAP = (
+    "m1", "m2", "m4", "m8",
+    "--reserved--", "mf8", "mf4", "mf2",
+)
+
+
+def _compute_vtype(vtype: int) -> str:
+
     vlmul_raw = vtype & 0x7
     vsew = (vtype >> 3) & 0x7
     vta = (vtype >> 6) & 0x1
     vma = (vtype >> 7) & 0x1
     
-    # e8  SEW=8b 
-    # e16 SEW=16b 
-    # e32 SEW=32b 
-    # e64 SEW=64b 
-    sew_map = {0: "e8", 1: "e16", 2: "e32", 3: "e64"}
-    sew = sew_map.get(vsew)
+    sew = _SEW_MAP[vsew]
+    lmul = _LMUL_MAP[vlmul_raw]
     
-    # mf8  # LMUL=1/8 
-    # mf4  # LMUL=1/4 
-    # mf2  # LMUL=1/2 
-    # m1   # LMUL=1, assumed if m setting absent 
-    # m2   # LMUL=2 
-    # m4   # LMUL=4 
-    # m8   # LMUL=8
-    lmul_map = {
-        0: "m1", 1: "m2", 2: "m4", 3: "m8",
-        4: "--reserved--", 5: "mf8", 6: "mf4", 7: "mf2"
-    }
-    lmul = lmul_map.get(vlmul_raw)
-    
-    ta = "tu" if vta == 0 else "ta"
-    ma = "mu" if vma == 0 else "ma"
+    ta = ("tu", "ta")[vta]
+    ma = ("mu", "ma")[vma]
     
     return f"{sew}, {lmul}, {ta}, {ma}"
 
-def format_OPCFG(instruction, vd_rd, vs1_rs1, vs2) -> str:
+
+# Only the low 8 bits of vtype are decoded, so every string is built once here
+_VTYPE = tuple(sys.intern(_compute_vtype(vtype)) for vtype in range(256))
+
+
+def decode_vtype(vtype: int, vll: int) -> str:
+
+    if vll == 0b1:
+        return "ILLEGAL"
+    return _VTYPE[vtype & 0xFF]
+
+def format_OPCFG(instruction, vd_rd, vs1_rs1, vs2, funct6, vm) -> str:
     
-    # vsetvli
-    if ((instruction >> 31) & 0x1) == 0b0:
-        zimm = (instruction >> 20) & 0x7FF # bits [30:20]
-        vtype = zimm & 0x7FF  # bits [30:20]
+    mnemonic, _ = get_config_mnemonic(funct6, vm)
+
+    if mnemonic == 'vsetvli':
+        vtype = (instruction >> 20) & 0x7FF  # bits [30:20]
         vtype_str = decode_vtype(vtype, (vtype >> 10) & 0x1)
         return f"vsetvli x{vd_rd}, x{vs1_rs1}, {vtype_str}"
     
-    # vsetivli
-    elif ((instruction >> 30) & 0x3) == 0b11:
+    elif mnemonic == 'vsetivli':
         uimm = vs1_rs1  # bits [19:15]
         vtypei = (instruction >> 20) & 0x3FF  # bits [29:20]
         vtype_str = decode_vtype(vtypei, (vtypei >> 9) & 0x1)
         return f"vsetivli x{vd_rd}, {uimm}, {vtype_str}"
     
-    # vsetvl
-    elif ((instruction >> 25) & 0x7F) == 0b1000000:
+    elif mnemonic == 'vsetvl':
         return f"vsetvl x{vd_rd}, x{vs1_rs1}, x{vs2}"
     
     else:
         return "INVALID OPCFG"
 
+
+# Element width of vector loads/stores, indexed by the width field. The other
+# encodings are scalar FP loads/stores
+_EEW = ("8", None, None, None, None, "16", "32", "64")
+
+
+# Kinds of load/store returned with the mnemonic, as bit flags
+KIND_WHOLE = 1      # Whole register
+KIND_MASK = 2       # Mask (vlm/vsm)
+KIND_STRIDED = 4
+KIND_INDEXED = 8
+KIND_SEGMENT = 16   # Combined with KIND_UNIT/KIND_STRIDED/KIND_INDEXED
+KIND_UNIT = 32
+
+
+def _load_unit_stride(lumop: int, nf: int, eew: str) -> Tuple[str, int]:
+
+    if lumop == 0b01000:
+        return f"vl{nf + 1}re{eew}", KIND_WHOLE
+    elif lumop == 0b01011:
+        return "vlm", KIND_MASK
+
+    # Fault-only-first, anything else defaults to a plain unit-stride load
+    ff = "ff" if lumop == 0b10000 else ""
+    if nf == 0:
+        return f"vle{eew}{ff}", KIND_UNIT
+    return f"vlseg{nf + 1}e{eew}{ff}", KIND_UNIT | KIND_SEGMENT
+
+
+def _store_unit_stride(sumop: int, nf: int, eew: str) -> Tuple[str, int]:
+
+    if sumop == 0b01000:
+        return f"vs{nf + 1}r", KIND_WHOLE
+    elif sumop == 0b01011:
+        return "vsm", KIND_MASK
+
+    # Default to unit-stride
+    if nf == 0:
+        return f"vse{eew}", KIND_UNIT
+    return f"vsseg{nf + 1}e{eew}", KIND_UNIT | KIND_SEGMENT
+
+
+# Unit-stride handlers indexed by is_store
+_UNIT_STRIDE = (_load_unit_stride, _store_unit_stride)
+
+# The other addressing modes, indexed [is_store][mop]:
+# (template, segment template taking nf + 1, kind)
+_LS_FORMS = (
+    (None,                                          # unit-stride
+     ("vluxei%s", "vluxseg%dei%s", KIND_INDEXED),   # indexed-unordered
+     ("vlse%s", "vlsseg%de%s", KIND_STRIDED),       # strided
+     ("vloxei%s", "vloxseg%dei%s", KIND_INDEXED)),  # indexed-ordered
+    (None,
+     ("vsuxei%s", "vsuxseg%dei%s", KIND_INDEXED),
+     ("vsse%s", "vssseg%de%s", KIND_STRIDED),
+     ("vsoxei%s", "vsoxseg%dei%s", KIND_INDEXED)),
+)
+
+
 # Page 29-39 of RISC-V V spec 1.0
-def get_load_store_mnemonic(opcode: int, width: int, mop: int, mew: int, nf: int, lumop_sumop_rs2_vs2: int) -> Optional[str]:
-    is_load = (opcode == 0x07)
-    is_store = (opcode == 0x27)
+def get_load_store_mnemonic(opcode: int, width: int, mop: int, mew: int, nf: int, lumop_sumop_rs2_vs2: int) -> Tuple[Optional[str], int]:
+    is_store = (opcode == _STORE_FP)
     
-    if not (is_load or is_store):
-        return None
+    if not is_store and opcode != _LOAD_FP:
+        return None, 0
     
-    eew_map = {
-        0b000: "8",
-        0b101: "16",
-        0b110: "32",
-        0b111: "64",
-    }
-
-    eew = eew_map.get(width)
+    eew = _EEW[width]
     if eew is None:
-        return None
+        return None, 0
     #     # Scalar FP loads/stores are not supported since they are not vector instructions but for some reason are mentioned in the spec
     #     if width == 0b001:
     #         return "flh" if is_load else "fsh"
@@ -608,82 +809,16 @@ def get_load_store_mnemonic(opcode: int, width: int, mop: int, mew: int, nf: int
     #         return "flq" if is_load else "fsq"
     #     return None
     
-    nfields = nf + 1
-    
-    if is_load:
-        if mop == 0b00:  # unit-stride
-            if lumop_sumop_rs2_vs2 == 0b00000:
-                if nf == 0:
-                    return f"vle{eew}"
-                else:
-                    return f"vlseg{nfields}e{eew}"
-            elif lumop_sumop_rs2_vs2 == 0b01000:
-                return f"vl{nfields}re{eew}"
-            elif lumop_sumop_rs2_vs2 == 0b01011:
-                return "vlm"
-            elif lumop_sumop_rs2_vs2 == 0b10000:
-                if nf == 0:
-                    return f"vle{eew}ff"
-                else:
-                    return f"vlseg{nfields}e{eew}ff"
-            else:
-                if nf == 0:
-                    return f"vle{eew}"
-                else:
-                    return f"vlseg{nfields}e{eew}"
-                
-        elif mop == 0b01:  # indexed-unordered
-            if nf == 0:
-                return f"vluxei{eew}"
-            else:
-                return f"vluxseg{nfields}ei{eew}"
-        elif mop == 0b10:  # strided
-            if nf == 0:
-                return f"vlse{eew}"
-            else:
-                return f"vlsseg{nfields}e{eew}"
-        elif mop == 0b11:  # indexed-ordered
-            if nf == 0:
-                return f"vloxei{eew}"
-            else:
-                return f"vloxseg{nfields}ei{eew}"
-    else:  # store
-        if mop == 0b00:  # unit-stride
-            if lumop_sumop_rs2_vs2 == 0b00000:
-                if nf == 0:
-                    return f"vse{eew}"
-                else:
-                    return f"vsseg{nfields}e{eew}"
-            elif lumop_sumop_rs2_vs2 == 0b01000:
-                return f"vs{nfields}r"
-            elif lumop_sumop_rs2_vs2 == 0b01011:
-                return "vsm"
-            else:
-                # Default to unit-stride
-                if nf == 0:
-                    return f"vse{eew}"
-                else:
-                    return f"vsseg{nfields}e{eew}"
-        elif mop == 0b01:  # indexed-unordered
-            if nf == 0:
-                return f"vsuxei{eew}"
-            else:
-                return f"vsuxseg{nfields}ei{eew}"
-        elif mop == 0b10:  # strided
-            if nf == 0:
-                return f"vsse{eew}"
-            else:
-                return f"vssseg{nfields}e{eew}"
-        elif mop == 0b11:  # indexed-ordered
-            if nf == 0:
-                return f"vsoxei{eew}"
-            else:
-                return f"vsoxseg{nfields}ei{eew}"
-    
-    return None
+    if mop == 0b00:
+        return _UNIT_STRIDE[is_store](lumop_sumop_rs2_vs2, nf, eew)
 
+    template, segment_template, kind = _LS_FORMS[is_store][mop]
+    if nf == 0:
+        return template % eew, kind
+    return segment_template % (nf + 1, eew), kind | KIND_SEGMENT
 
-def format_load_store(instruction: int, opcode: int, vd_vs3: int, width: int, rs1: int, vm: int) -> str:
+
+def _load_store_template(instruction: int, opcode: int, width: int, vm: int) -> Optional[str]:
     
     # bits [6:0] opcode 
     # bits [7:11] vd (destination of load) or vs3 (store data)
@@ -700,41 +835,35 @@ def format_load_store(instruction: int, opcode: int, vd_vs3: int, width: int, rs
     mew = (instruction >> 28) & 0x1
     nf = (instruction >> 29) & 0x7
     
-    mnemonic = get_load_store_mnemonic(opcode, width, mop, mew, nf, lumop_sumop_rs2_vs2)
+    mnemonic, kind = get_load_store_mnemonic(opcode, width, mop, mew, nf, lumop_sumop_rs2_vs2)
     if mnemonic is None:
-        return "UNKNOWN"
+        return None
     
+    # The vd/vs3 and rs1 operands are left as %d slots
     # Whole register load: vl1re8.v v1, (x1) 
     # Whole register store: vs1r.v v1, (x1)
     # Mask load/store: vlm.v v1, (x1)
-    if (mnemonic.startswith("vl") and "re" in mnemonic) or (mnemonic.startswith("vs") and mnemonic.endswith("r")) or (mnemonic in ["vlm", "vsm"]):
-        return f"{mnemonic}.v v{vd_vs3}, (x{rs1})"
+    if kind & (KIND_WHOLE | KIND_MASK):
+        return f"{mnemonic}.v v%d, (x%d)"
     
     # Strided segment: vlsseg3e8.v v1, (x1), x2 [, v0.t]
     # Strided non-segment: vlse64.v v1, (x1), x2 [, v0.t]
- 
-    elif (("sseg" in mnemonic or "lseg" in mnemonic) and mop == 0b10) or ("se" in mnemonic and mop == 0b10 and "seg" not in mnemonic) or ("xseg" in mnemonic) or ("xei" in mnemonic):
+    elif kind & KIND_STRIDED:
         if vm == 0:
-            return f"{mnemonic}.v v{vd_vs3}, (x{rs1}), x{lumop_sumop_rs2_vs2}, v0.t"
+            return f"{mnemonic}.v v%d, (x%d), x{lumop_sumop_rs2_vs2}, v0.t"
         else:
-            return f"{mnemonic}.v v{vd_vs3}, (x{rs1}), x{lumop_sumop_rs2_vs2}"
-    
+            return f"{mnemonic}.v v%d, (x%d), x{lumop_sumop_rs2_vs2}"
+
     # Indexed segment: vluxseg3ei32.v v1, (x1), v2 [, v0.t]
-    # Indexed non-segment: vluxei64.v v1, (x1), v2 [, v0.t]  
-    elif ("xseg" in mnemonic) or ("xei" in mnemonic):
+    # Indexed non-segment: vluxei64.v v1, (x1), v2 [, v0.t]
+    # Known issue: the index register is printed as x<n> instead of v<n>,
+    # kept for output compatibility
+    elif kind & KIND_INDEXED:
         if vm == 0:
-            return f"{mnemonic}.v v{vd_vs3}, (x{rs1}), v{lumop_sumop_rs2_vs2}, v0.t"
+            return f"{mnemonic}.v v%d, (x%d), x{lumop_sumop_rs2_vs2}, v0.t"
         else:
-            return f"{mnemonic}.v v{vd_vs3}, (x{rs1}), v{lumop_sumop_rs2_vs2}"
+            return f"{mnemonic}.v v%d, (x%d), x{lumop_sumop_rs2_vs2}"
 
-    # Unit-stride segment: vlseg3e8.v v1, (x1) [, v0.t]
-    # Unit-stride non-segment: vle64.v v1, (x1) [, v0.t]
-    elif ("seg" in mnemonic and (mnemonic.startswith("vl") or mnemonic.startswith("vs"))) or (mnemonic.startswith("vle") or mnemonic.startswith("vse")):
-        if vm == 0:
-            return f"{mnemonic}.v v{vd_vs3}, (x{rs1}), v0.t"
-        else:
-            return f"{mnemonic}.v v{vd_vs3}, (x{rs1})"
-    
     # TODO scalar FP loads/stores are not part of the RISC-V V spec but are mentioned for some reason I won't be implementing them for now
     # Scalar FP loads/stores: fld f1, 0(x1)
     # elif mnemonic.startswith("fl") or mnemonic.startswith("fs"):
@@ -742,164 +871,302 @@ def format_load_store(instruction: int, opcode: int, vd_vs3: int, width: int, rs
     #     if imm & 0x800:
     #         imm = imm - 0x1000
     #     return f"{mnemonic} ft{vd_vs3}, {imm}(x{rs1})"
-    
-    # Generic format
+
+    # Unit-stride segment: vlseg3e8.v v1, (x1) [, v0.t]
+    # Unit-stride non-segment: vle64.v v1, (x1) [, v0.t]
     else:
         if vm == 0:
-            return f"{mnemonic}.v v{vd_vs3}, (x{rs1}), v0.t"
+            return f"{mnemonic}.v v%d, (x%d), v0.t"
         else:
-            return f"{mnemonic}.v v{vd_vs3}, (x{rs1})"
+            return f"{mnemonic}.v v%d, (x%d)"
+
+
+# Load/store output templates, memoized per template input: bits [31:20] of
+# the instruction word plus the opcode, width and vm arguments
+_LS_TEMPLATES = {}
+
+
+def format_load_store(instruction: int, opcode: int, vd_vs3: int, width: int, rs1: int, vm: int) -> str:
+
+    # opcode, width and vm come from the arguments rather than the word, so
+    # direct callers passing other values still get the matching template
+    key = (instruction & 0xFDF00000) | (vm << 25) | (width << 12) | opcode
+    try:
+        template = _LS_TEMPLATES[key]
+    except KeyError:
+        template = _LS_TEMPLATES[key] = _load_store_template(instruction, opcode, width, vm)
+    if template is None:
+        return "UNKNOWN"
+    return template % (vd_vs3, rs1)
 
 
 def sign_extend_imm5(imm5: int) -> int:
 
-    imm5 = imm5 & 0x1F
-    if imm5 & 0x10:
-        return imm5 - 32
-    return imm5
-
-def suffix_calculation(mnemonic: str, category: str, vm: int) -> str:
-
-    base_suffix_map = {
-        'OPIVV': '.vv',
-        'OPIVX': '.vx',
-        'OPIVI': '.vi',
-        'OPFVV': '.vv',
-        'OPFVF': '.vf',
-        'OPMVV': '.vv',
-        'OPMVX': '.vx',
-        'OPCFG': '',
-    }
-    
-    suffix = base_suffix_map.get(category, '')
+    # Flipping the sign bit and subtracting it back sign extends without a branch
+    return ((imm5 & 0x1F) ^ 0x10) - 0x10
+
+# Base suffix of each operand category, indexed by funct3
+_SUFFIX = ('.vv', '.vv', '.vv', '.vi', '.vx', '.vf', '.vx', '')
+
+# Mnemonics whose suffix departs from the category default
+_CARRY_BORROW_MERGE = frozenset({'vmadc', 'vmsbc', 'vadc', 'vsbc', 'vmerge', 'vfmerge'})
+_NCLIP = frozenset({'vnclipu', 'vnclip'})
+_REDUCTIONS = frozenset({
+    'vredsum', 'vredmaxu', 'vredmax', 'vredminu', 'vredmin',
+    'vredand', 'vredor', 'vredxor',
+    'vfredusum', 'vfredosum', 'vfredmin', 'vfredmax', 'vfwredusum', 'vfwredosum',
+})
+_MASK_LOGIC = frozenset({
+    'vmand', 'vmnand', 'vmandn', 'vmxor',
+    'vmor', 'vmnor', 'vmorn', 'vmxnor', 'vmandnot', 'vmornot',
+})
+
+
+def suffix_calculation(mnemonic: str, funct3: int, vm: int) -> str:
+
+    suffix = _SUFFIX[funct3]
     
     # Handle special cases for suffixes based on the mnemonic and category
-    if mnemonic in ['vmadc', 'vmsbc', 'vadc', 'vsbc', 'vmerge', 'vfmerge']:
+    if mnemonic in _CARRY_BORROW_MERGE:
         if vm == 0:
             suffix += 'm'
             
-    elif mnemonic in ['vnclipu', 'vnclip']:
+    elif mnemonic in _NCLIP:
         if vm == 0:
-            if category == 'OPIVV':
+            if funct3 == _OPIVV:
                 suffix = '.wv'
-            if category == 'OPIVX':
+            if funct3 == _OPIVX:
                 suffix = '.wx'
-            elif category == 'OPIVI':
+            elif funct3 == _OPIVI:
                 suffix = '.wi'
                 
     elif mnemonic[-2:] == '.w':
-        suffix = 'v' if category in ['OPMVV', 'OPFVV'] else 'x' if category == 'OPMVX' else 'f'
+        suffix = 'v' if funct3 == _OPMVV or funct3 == _OPFVV else 'x' if funct3 == _OPMVX else 'f'
     
-    elif category in ['OPMVV', 'OPFVV']:
-        if mnemonic in ['vredsum', 'vredmaxu', 'vredmax', 'vredminu', 'vredmin',
-                        'vredand', 'vredor', 'vredxor', 
-                        'vfredusum', 'vfredosum', 'vfredmin', 'vfredmax', 'vfwredusum', 'vfwredosum']:
+    elif funct3 == _OPMVV or funct3 == _OPFVV:
+        if mnemonic in _REDUCTIONS:
             suffix = '.vs'
-        elif mnemonic in ['vmand', 'vmnand', 'vmandn', 'vmxor', 
-                         'vmor', 'vmnor', 'vmorn', 'vmxnor', 'vmandnot', 'vmornot']:
+        elif mnemonic in _MASK_LOGIC:
             suffix = '.mm'
         elif mnemonic == 'vcompress':
             suffix = '.vm'
     return suffix
 
-def format_instruction(mnemonic: str, category: str, vd_rd: int, vs2: int,
-                      vs1_rs1: int, imm5: int, vm: int, special: bool) -> str:
+
+# Operand layout of the regular instructions, indexed by (funct3 << 1) | vm
+_FMT = (
+    " v%d, v%d, v%d, v0.t", " v%d, v%d, v%d",    # OPIVV
+    " v%d, v%d, v%d, v0.t", " v%d, v%d, v%d",    # OPFVV
+    " v%d, v%d, v%d, v0.t", " v%d, v%d, v%d",    # OPMVV
+    " v%d, v%d, %d, v0.t", " v%d, v%d, %d",      # OPIVI
+    " v%d, v%d, x%d, v0.t", " v%d, v%d, x%d",    # OPIVX
+    " v%d, v%d, x%d, v0.t", " v%d, v%d, x%d",    # OPFVF
+    " v%d, v%d, x%d, v0.t", " v%d, v%d, x%d",    # OPMVX
+    None, None,                                  # OPCFG
+)
+
+
+def _build_full_mnemonics() -> dict:
+
+    # mnemonic + suffix keyed by (mnemonic, funct3, vm), only for the regular
+    # mnemonics _MNEM_TABLE leaves out (vmerge, which shares its slot with the
+    # vmv.v.* moves). Every other slot is served by _TEMPLATE_TABLE
+    full = {}
+    for funct3, opcode_map in _OPCODE_MAPS:
+        for funct6, mnemonic in opcode_map.items():
+            if mnemonic in _SUBDECODED_MNEMONICS or _MNEM_TABLE[(funct3 << 6) | funct6] is not None:
+                continue
+            mnemonic = sys.intern(mnemonic)
+            for vm in (0, 1):
+                full[mnemonic, funct3, vm] = sys.intern(mnemonic + suffix_calculation(mnemonic, funct3, vm))
+    return full
+
+
+_FULL_MNEMONIC = _build_full_mnemonics()
+
+
+# Where the second operand of a special template comes from
+_SRC_VS2, _SRC_VS1, _SRC_IMM, _SRC_NONE = range(4)
+
+# Mask-taking unary operations printed as "vd, vs2[, v0.t]"
+_UNARY_VS2_MNEMONICS = (
+    'vzext.vf8', 'vsext.vf8', 'vzext.vf4', 'vsext.vf4',
+    'vzext.vf2', 'vsext.vf2', 'vmsbf.m', 'vmsof.m', 'vmsif.m', 'viota.m',
+    'vfcvt.xu.f.v', 'vfcvt.x.f.v', 'vfcvt.f.xu.v',
+    'vfcvt.f.x.v', 'vfcvt.rtz.xu.f.v', 'vfcvt.rtz.x.f.v',
+    'vfwcvt.xu.f.v', 'vfwcvt.x.f.v', 'vfwcvt.f.xu.v', 'vfwcvt.f.x.v', 'vfwcvt.f.f.v',
+    'vfwcvt.rtz.xu.f.v', 'vfwcvt.rtz.x.f.v',
+    'vfncvt.xu.f.w', 'vfncvt.x.f.w', 'vfncvt.f.xu.w', 'vfncvt.f.x.w', 'vfncvt.f.f.w',
+    'vfncvt.rod.f.f.w', 'vfncvt.rtz.xu.f.w', 'vfncvt.rtz.x.f.w',
+    'vfsqrt.v', 'vfrsqrt7.v', 'vfrec7.v', 'vfclass.v',
+)
+
+
+def _build_special_formats() -> dict:
+
+    # mnemonic -> ((template for vm=0, template for vm=1), operand source)
+    formats = {}
+    for mnemonic in ('vmv.x.s', 'vfmv.f.s', 'vcpop.m', 'vfirst.m'):
+        formats[mnemonic] = ((mnemonic + " x%d, v%d",) * 2, _SRC_VS2)
+    for mnemonic in ('vmv.s.x', 'vfmv.s.f', 'vmv.v.x'):
+        formats[mnemonic] = ((mnemonic + " v%d, x%d",) * 2, _SRC_VS1)
+    formats['vmv.v.v'] = (("vmv.v.v v%d, v%d",) * 2, _SRC_VS1)
+    formats['vmv.v.i'] = (("vmv.v.i v%d, %d",) * 2, _SRC_IMM)
+    for mnemonic in _UNARY_VS2_MNEMONICS:
+        formats[mnemonic] = ((mnemonic + " v%d, v%d, v0.t", mnemonic + " v%d, v%d"), _SRC_VS2)
+    formats['vid.v'] = (("vid.v v%d, v0.t", "vid.v v%d"), _SRC_NONE)
+    return {sys.intern(mnemonic): (tuple(sys.intern(t) for t in templates), source)
+            for mnemonic, (templates, source) in formats.items()}
+
+
+_SPECIAL_FORMATS = _build_special_formats()
+
+
+def format_instruction(mnemonic: str, funct3: int, vd_rd: int, vs2: int,
+                      vs1_rs1: int, vm: int, special: bool) -> str:
 
     # Special operations have a very unique format...
     if special:
-        if mnemonic in ['vmv.x.s', 'vfmv.f.s', 'vcpop.m', 'vfirst.m']:
-            return f"{mnemonic} x{vd_rd}, v{vs2}"
-        
-        elif mnemonic in ['vmv.s.x', 'vfmv.s.f', 'vmv.v.x']:
-            return f"{mnemonic} v{vd_rd}, x{vs1_rs1}"
-        
-        elif mnemonic in ['vmv.v.v']:
-            return f"{mnemonic} v{vd_rd}, v{vs1_rs1}"
-        
-        elif mnemonic in ['vmv.v.i']:
-            return f"{mnemonic} v{vd_rd}, {sign_extend_imm5(imm5)}"
-        
-        elif mnemonic in ['vzext.vf8', 'vsext.vf8', 'vzext.vf4', 'vsext.vf4',
-                          'vzext.vf2', 'vsext.vf2', 'vmsbf.m', 'vmsof.m', 'vmsif.m', 'viota.m',
-                          'vfcvt.xu.f.v', 'vfcvt.x.f.v', 'vfcvt.f.xu.v', 
-                          'vfcvt.f.x.v', 'vfcvt.rtz.xu.f.v', 'vfcvt.rtz.x.f.v',
-                          'vfwcvt.xu.f.v','vfwcvt.x.f.v','vfwcvt.f.xu.v','vfwcvt.f.x.v','vfwcvt.f.f.v',
-                          'vfwcvt.rtz.xu.f.v','vfwcvt.rtz.x.f.v',
-                          'vfncvt.xu.f.w','vfncvt.x.f.w','vfncvt.f.xu.w','vfncvt.f.x.w','vfncvt.f.f.w',
-                          'vfncvt.rod.f.f.w','vfncvt.rtz.xu.f.w','vfncvt.rtz.x.f.w',
-                          'vfsqrt.v', 'vfrsqrt7.v', 'vfrec7.v', 'vfclass.v']:
-            if vm == 0:
-                return f"{mnemonic} v{vd_rd}, v{vs2}, v0.t"
-            else:
-                return f"{mnemonic} v{vd_rd}, v{vs2}"
-            
-        elif mnemonic == 'vid.v':
-            if vm == 0:
-                return f"{mnemonic} v{vd_rd}, v0.t"
-            else:
-                return f"{mnemonic} v{vd_rd}"
-            
-        elif mnemonic == 'vmv':
-                nr = vs1_rs1 + 1
-                return f"{mnemonic}{nr}r.v v{vd_rd}, v{vs2}"
-        else:
+        entry = _SPECIAL_FORMATS.get(mnemonic)
+        if entry is None:
+            if mnemonic == 'vmv':
+                return f"vmv{vs1_rs1 + 1}r.v v{vd_rd}, v{vs2}"
             return f"{mnemonic} v{vd_rd}, v{vs2}"
+
+        templates, source = entry
+        template = templates[vm]
+        if source == _SRC_VS2:
+            return template % (vd_rd, vs2)
+        if source == _SRC_VS1:
+            return template % (vd_rd, vs1_rs1)
+        if source == _SRC_IMM:
+            return template % (vd_rd, (vs1_rs1 ^ 0x10) - 0x10)
+        return template % vd_rd
     
-    suffix = suffix_calculation(mnemonic, category, vm)
-    full_mnemonic = f"{mnemonic}{suffix}"
+    template = _FMT[(funct3 << 1) | vm]
+    if template is None:
+        return "UNKNOWN FORMAT"
 
-    if category in ['OPIVV', 'OPMVV', 'OPFVV']:
-        if vm == 0:
-            return f"{full_mnemonic} v{vd_rd}, v{vs2}, v{vs1_rs1}, v0.t"
-        else:
-            return f"{full_mnemonic} v{vd_rd}, v{vs2}, v{vs1_rs1}"
+    operand = (vs1_rs1 ^ 0x10) - 0x10 if funct3 == _OPIVI else vs1_rs1
+    full_mnemonic = _FULL_MNEMONIC.get((mnemonic, funct3, vm))
+    if full_mnemonic is None:
+        full_mnemonic = mnemonic + suffix_calculation(mnemonic, funct3, vm)
+    return full_mnemonic + template % (vd_rd, vs2, operand)
 
-    elif category in ['OPIVX', 'OPMVX']:
-        if vm == 0:
-            return f"{full_mnemonic} v{vd_rd}, v{vs2}, x{vs1_rs1}, v0.t"
-        else:
-            return f"{full_mnemonic} v{vd_rd}, v{vs2}, x{vs1_rs1}"
 
-    elif category == 'OPIVI':
-        imm_val = sign_extend_imm5(imm5)
-        if vm == 0:
-            return f"{full_mnemonic} v{vd_rd}, v{vs2}, {imm_val}, v0.t"
-        else:
-            return f"{full_mnemonic} v{vd_rd}, v{vs2}, {imm_val}"
+def _build_template_table() -> Tuple[Optional[str], ...]:
 
-    elif category == 'OPFVF':
-        if vm == 0:
-            return f"{full_mnemonic} v{vd_rd}, v{vs2}, x{vs1_rs1}, v0.t"
-        else:
-            return f"{full_mnemonic} v{vd_rd}, v{vs2}, x{vs1_rs1}"
-    
-    else:
-        return "UNKNOWN FORMAT"
-    
+    # Complete output template of every regular instruction, mnemonic and
+    # suffix included, indexed by (((funct3 << 6) | funct6) << 1) | vm
+    table = [None] * (8 * 64 * 2)
+    for index, mnemonic in enumerate(_MNEM_TABLE):
+        if mnemonic is None:
+            continue
+        funct3 = index >> 6
+        for vm in (0, 1):
+            suffix = suffix_calculation(mnemonic, funct3, vm)
+            table[(index << 1) | vm] = sys.intern(mnemonic + suffix + _FMT[(funct3 << 1) | vm])
+    return tuple(table)
+
+
+_TEMPLATE_TABLE = _build_template_table()
 
+
+# The same instruction words tend to repeat (loops, unrolled kernels), so the
+# decoded text is memoized per 32-bit word
+@functools.lru_cache(maxsize=8192)
 def disassemble_rvv(instruction: int) -> str:
 
-    opcode, funct6, vm, vs2, vs1_rs1, funct3, vd_rd, imm5 = extract_fields(instruction)
-    
-    if opcode == 0x07 or opcode == 0x27:
-        return format_load_store(instruction, opcode, vd_rd, funct3, vs1_rs1, vm)
-    
-    if opcode != 0x57:
-        return "UNKNOWN opcode"
+    # page 21 of RISC-V V spec 1.0. Fields are extracted only once the path
+    # that needs them is known
+    opcode = instruction & 0x7F          # bits [6:0]
+    funct3 = (instruction >> 12) & 0x7   # bits [14:12]
     
-    category = get_operand_category(funct3)
-    if category is None:
-        return "UNKNOWN func3"
+    if opcode == _OP_V:
+        vd_rd = (instruction >> 7) & 0x1F    # bits [11:7]
+        vs1_rs1 = (instruction >> 15) & 0x1F # bits [19:15]
+        vs2 = (instruction >> 20) & 0x1F     # bits [24:20]
+
+        if funct3 == _OPCFG:
+            return format_OPCFG(instruction, vd_rd, vs1_rs1, vs2,
+                                (instruction >> 26) & 0x3F, (instruction >> 25) & 0x1)
+
+        # Regular instructions only need their operands filled in. funct6 and vm
+        # are adjacent (bits [31:25]), so the table index is taken straight from
+        # the instruction word: funct3 << 7 | funct6 << 1 | vm
+        template = _TEMPLATE_TABLE[((instruction >> 5) & 0x380) | ((instruction >> 25) & 0x7F)]
+        if template is not None:
+            if funct3 == _OPIVI:
+                return template % (vd_rd, vs2, (vs1_rs1 ^ 0x10) - 0x10)  # sign extended imm5
+            return template % (vd_rd, vs2, vs1_rs1)
+
+        vm = (instruction >> 25) & 0x1       # bit [25]
+        funct6 = (instruction >> 26) & 0x3F  # bits [31:26]
+        mnemonic, special = get_mnemonic(funct6, funct3, vs2, vs1_rs1, vm)
+
+        if mnemonic is None:
+            return "UNKNOWN mnemonic"
+
+        return format_instruction(mnemonic, funct3, vd_rd, vs2, vs1_rs1, vm, special)
     
-    if category == 'OPCFG':
-        return format_OPCFG(instruction, vd_rd, vs1_rs1, vs2)
+    if opcode == _LOAD_FP or opcode == _STORE_FP:
+        return format_load_store(instruction, opcode, (instruction >> 7) & 0x1F, funct3,
+                                 (instruction >> 15) & 0x1F, (instruction >> 25) & 0x1)
     
-    mnemonic, special = get_mnemonic(funct6, category, vs2, vs1_rs1, vm)
+    return "UNKNOWN opcode"
 
-    if mnemonic is None:
-        return "UNKNOWN mnemonic"
 
-    return format_instruction(mnemonic, category, vd_rd, vs2, vs1_rs1, imm5, vm, special)
+def _as_ints(instructions: Iterable[int]) -> Iterable[int]:
+
+    # Any iterable of instruction words as plain ints. Typed arrays (array.array('I'),
+    # numpy uint32 arrays, ...) convert in one C call with tolist(), which is much
+    # cheaper than int() on every element; anything else is mapped through int()
+    tolist = getattr(instructions, 'tolist', None)
+    if tolist is not None:
+        return tolist()
+    return map(int, instructions)
+
+
+def disassemble_batch(instructions: Iterable[int]) -> List[str]:
+
+    disassemble = disassemble_rvv
+    return [disassemble(instruction & 0xFFFFFFFF) for instruction in _as_ints(instructions)]
+
+
+def _unpack_words(buf: bytes) -> Iterable[int]:
+
+    # Raw little-endian instruction words, e.g. the contents of a .text section.
+    # struct.iter_unpack does the byte to int conversion in C
+    if len(buf) % 4:
+        raise ValueError(f"buffer length {len(buf)} is not a multiple of 4 bytes")
+    return (word for (word,) in struct.iter_unpack('<I', buf))
+
+
+def disassemble_bytes(buf: bytes) -> List[str]:
+
+    disassemble = disassemble_rvv
+    return [disassemble(word) for word in _unpack_words(buf)]
+
+
+def disassemble_stream(instructions: Iterable[int], out: Optional[TextIO] = None,
+                       lines_per_write: int = 4096) -> None:
+
+    # Writes one line per instruction word to out (stdout by default). Lines
+    # are joined and written in chunks, a few large writes instead of a print
+    # per instruction, without holding the whole output in memory
+    if lines_per_write < 1:
+        raise ValueError(f"lines_per_write must be at least 1, got {lines_per_write}")
+    if out is None:
+        out = sys.stdout
+    words = iter(_as_ints(instructions))
+    disassemble = disassemble_rvv
+    while True:
+        lines = [disassemble(instruction & 0xFFFFFFFF)
+                 for instruction in itertools.islice(words, lines_per_write)]
+        if not lines:
+            break
+        lines.append('')
+        out.write('\n'.join(lines))
 
 
 def main():
@@ -908,17 +1175,31 @@ def main():
         python rvv_disassembler.py <instruction>
         python rvv_disassembler.py 0x5e0ec057
         python rvv_disassembler.py 1578102871
+        python rvv_disassembler.py --binary text.bin
     """
-    import sys
-    
-    if len(sys.argv) < 2:
+    if len(sys.argv) < 2 or (sys.argv[1] == '--binary' and len(sys.argv) < 3):
         print("Usage: python rvv_disassembler.py <instruction>")
+        print("       python rvv_disassembler.py --binary <file>")
         print("  instruction can be in hex (0x...) or decimal format")
+        print("  file holds raw little-endian 32-bit instruction words")
         print("\nExamples:")
         print("  python rvv_disassembler.py 0x5e0ec057")
         print("  python rvv_disassembler.py 1578102871")
+        print("  python rvv_disassembler.py --binary text.bin")
         sys.exit(1)
     
+    # Whole file, written through disassemble_stream in chunks instead of a
+    # print per instruction
+    if sys.argv[1] == '--binary':
+        try:
+            with open(sys.argv[2], 'rb') as f:
+                words = _unpack_words(f.read())
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        disassemble_stream(words)
+        return
+    
     instruction_str = sys.argv[1].strip()
     
     try: